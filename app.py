@@ -1,17 +1,23 @@
 import streamlit as st
 import pandas as pd
+import openpyxl
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
 from io import BytesIO
-import time
-from bs4 import BeautifulSoup
-from groq import Groq
-from langgraph.graph import StateGraph
+import asyncio
+import threading
+from selectolax.parser import HTMLParser, Node
+from groq import AsyncGroq, AuthenticationError, PermissionDeniedError, RateLimitError
 from typing import TypedDict, Optional
-from tavily import TavilyClient
-import json
-from urllib.parse import urlencode
-
-# Firecrawl SDK
-from firecrawl import FirecrawlApp
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+import re
+import hashlib
+import httpx
+import ahocorasick
+from cachetools import TTLCache
+from urllib.parse import urljoin
 
 # ------------------------- JOB STATE DEFINITION -------------------------
 class JobState(TypedDict):
@@ -36,156 +42,338 @@ FIELD_KEYWORDS = {
     "General Management": "general management",
     "Product Management": "product management"
 }
-GLOBAL_FIELD: str = ""
+# Casefolded keyword variants per field, computed once at import
+FIELD_VARIANTS = {
+    field: [v.casefold() for v in keywords.split()] + [field.casefold()]
+    for field, keywords in FIELD_KEYWORDS.items()
+}
+
+def build_keyword_automaton() -> ahocorasick.Automaton:
+    # each keyword maps to every field it signals, e.g. "management"
+    fields_by_keyword: dict[str, set] = {}
+    for field, variants in FIELD_VARIANTS.items():
+        for kw in variants:
+            fields_by_keyword.setdefault(kw, set()).add(field)
+    ac = ahocorasick.Automaton()
+    for kw, fields in fields_by_keyword.items():
+        ac.add_word(kw, frozenset(fields))
+    ac.make_automaton()
+    return ac
+
+# Single-pass matcher over all field keywords
+KEYWORD_AUTOMATON = build_keyword_automaton()
+
+# EdTech competitors whose openings are excluded from the results
+COMPETITORS = frozenset(name.casefold() for name in [
+    "BYJU'S","Unacademy","Vedantu","Toppr","UpGrad","Simplilearn",
+    "WhiteHat Jr.","Classplus","Embibe","EduGorilla","iQuanta",
+    "TrainerCentral","Meritnation","Testbook","Edukart","Adda247",
+    "CollegeDekho","Leverage Edu","Next Education","Infinity Learn"
+])
+# Whole-word match for company names like "BYJU'S Ltd". Lookarounds rather than \b,
+# since names such as "whitehat jr." end in punctuation.
+COMPETITOR_RE = re.compile(
+    r'(?<!\w)(?:' + '|'.join(map(re.escape, sorted(COMPETITORS))) + r')(?!\w)', re.IGNORECASE
+)
+# Upper bound on jobs processed concurrently, to stay within Groq rate limits
+MAX_CONCURRENT_JOBS = 20
+# Upper bound on concurrent career page lookups, to stay within Tavily rate limits
+MAX_CONCURRENT_LOOKUPS = 5
 
 # ------------------------- Tavily Helper Functions -------------------------
-def search_with_tavily(query: str, tavily_client: TavilyClient) -> str:
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+# Career page per canonical company name, shared across scrapes. Only
+# successful lookups are stored, so a failed one is retried next time.
+CAREER_PAGE_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+# Streamlit sessions run in separate threads and cachetools caches aren't thread-safe
+CAREER_PAGE_CACHE_LOCK = threading.Lock()
+
+async def search_with_tavily(query: str, hx: httpx.AsyncClient, api_key: str) -> str:
     try:
-        resp = tavily_client.search(query=query, max_results=1)
-        if "results" in resp and resp["results"]:
-            return resp["results"][0]["url"]
+        resp = await hx.post(
+            TAVILY_SEARCH_URL,
+            json={"query": query, "max_results": 1},
+            headers={"Authorization": f"Bearer {api_key}"}
+        )
+        resp.raise_for_status()
+        results = resp.json().get("results")
+        if results:
+            return results[0]["url"]
+    except httpx.HTTPStatusError as e:
+        # a rejected key fails every lookup, so surface it instead of "no link"
+        if e.response.status_code in (401, 403):
+            raise
     except Exception:
         pass
     return ""
 
-def get_company_career_page(company_name: str, tavily_client: TavilyClient) -> str:
-    url = search_with_tavily(f"{company_name} careers", tavily_client)
-    return url or search_with_tavily(company_name, tavily_client)
-
-# ------------------------- LANGGRAPH WORKFLOW FUNCTIONS -------------------------
-def check_relevance(state: JobState, client: Groq) -> JobState:
-    text = (state['Title'] + ' ' + state['Description']).lower()
-    # domain variants
-    variants = [v.strip() for v in FIELD_KEYWORDS.get(GLOBAL_FIELD, GLOBAL_FIELD).split()] + [GLOBAL_FIELD]
-    if any(kw in text for kw in variants):
-        state['is_relevant'] = 'Yes'
-        return state
-    prompt = f"""
-Job Title: {state['Title']}
-Company: {state['Company']}
-Description: {state['Description']}
-Is this a genuine {GLOBAL_FIELD} job? Respond {{"is_relevant":"Yes" or "No"}}.
-"""
-    try:
-        res = client.chat.completions.create(
-            messages=[{"role":"user","content":prompt}],
-            model="llama-3.3-70b-versatile"
-        )
-        out = json.loads(res.choices[0].message.content)
-        state['is_relevant'] = out.get('is_relevant','No')
-    except Exception:
-        state['is_relevant'] = 'No'
-    return state
+async def get_company_career_page(company_name: str, hx: httpx.AsyncClient, api_key: str) -> str:
+    url = await search_with_tavily(f"{company_name} careers", hx, api_key)
+    return url or await search_with_tavily(company_name, hx, api_key)
 
-def check_competitor(state: JobState, client: Groq) -> JobState:
-    competitor_list = [
-        "BYJU'S","Unacademy","Vedantu","Toppr","UpGrad","Simplilearn",
-        "WhiteHat Jr.","Classplus","Embibe","EduGorilla","iQuanta",
-        "TrainerCentral","Meritnation","Testbook","Edukart","Adda247",
-        "CollegeDekho","Leverage Edu","Next Education","Infinity Learn"
-    ]
-    prompt = f"Job Company: {state['Company']}\nIs it in {competitor_list}? Return {{\"is_competitor\": \"Yes\" or \"No\"}}."
-    try:
-        res = client.chat.completions.create(
-            messages=[{"role":"user","content":prompt}],
-            model="llama-3.3-70b-versatile"
-        )
-        out = json.loads(res.choices[0].message.content)
-        state['is_competitor'] = out.get('is_competitor','No')
-    except Exception:
-        state['is_competitor'] = 'No'
+async def get_career_pages(companies: set, hx: httpx.AsyncClient, api_key: str,
+                           sem: asyncio.Semaphore) -> dict[str, str]:
+    async def lookup(name: str) -> str:
+        async with sem:
+            return await get_company_career_page(name, hx, api_key)
+
+    # companies repeat across listings, canonicalize for a better hit rate
+    names = {c: c.strip().casefold() for c in companies}
+    with CAREER_PAGE_CACHE_LOCK:
+        found = {n: CAREER_PAGE_CACHE.get(n, '') for n in set(names.values())}
+    missing = [n for n, url in found.items() if not url]
+    if missing:
+        urls = await asyncio.gather(*[lookup(n) for n in missing])
+        found.update(zip(missing, urls))
+        with CAREER_PAGE_CACHE_LOCK:
+            CAREER_PAGE_CACHE.update((n, url) for n, url in zip(missing, urls) if url)
+    return {c: found[n] for c, n in names.items()}
+
+# ------------------------- JOB CLASSIFICATION -------------------------
+# Static prompt tails, built once instead of per job
+TIER_PROMPT = 'Respond in JSON: {"job_tier": "Fresher"|"Mid"|"Senior"}.'
+RELEVANCE_TIER_PROMPT = 'Is this a genuine {field} job? Respond in JSON: {{"is_relevant": "Yes"|"No", "job_tier": "Fresher"|"Mid"|"Senior"}}.'
+# Groq failures that hit every job; they must not pass as "not relevant"
+GROQ_FATAL_ERRORS = (AuthenticationError, PermissionDeniedError)
+# 429s are expected at this concurrency, so give the SDK's backoff more attempts
+GROQ_MAX_RETRIES = 6
+JOB_TIERS = frozenset({'Fresher', 'Mid', 'Senior'})
+
+def check_competitor(state: JobState) -> JobState:
+    company = state['Company'].casefold()
+    is_competitor = company in COMPETITORS or COMPETITOR_RE.search(company) is not None
+    state['is_competitor'] = 'Yes' if is_competitor else 'No'
     return state
 
-def determine_tier(state: JobState, client: Groq) -> JobState:
-    prompt = f"Job Title: {state['Title']}\nExperience: {state['Experience']}\nRespond {{\"job_tier\": \"Fresher\"/\"Mid\"/\"Senior\"}}."
+async def classify_job(state: JobState, client: AsyncGroq, field: str) -> JobState:
+    text = (state['Title'] + ' ' + state['Description']).casefold()
+    hits = {f for _, fields in KEYWORD_AUTOMATON.iter(text) for f in fields}
+    keyword_match = field in hits
+    prompt = f"Title: {state['Title']}\nExperience: {state['Experience']}\n"
+    if keyword_match:
+        # a keyword hit settles relevance, so only the tier is asked for
+        prompt += TIER_PROMPT
+    else:
+        prompt += f"Description: {state['Description']}\n" + RELEVANCE_TIER_PROMPT.format(field=field)
     try:
-        res = client.chat.completions.create(
+        res = await client.chat.completions.create(
             messages=[{"role":"user","content":prompt}],
-            model="llama-3.3-70b-versatile"
+            model="llama-3.1-8b-instant",
+            temperature=0,
+            response_format={"type":"json_object"}
         )
-        out = json.loads(res.choices[0].message.content)
-        state['job_tier'] = out.get('job_tier','N/A')
+        out = json_loads(res.choices[0].message.content)
+    except (*GROQ_FATAL_ERRORS, RateLimitError):
+        # a 429 that outlasts the retries fails only this job, not the whole domain
+        raise
     except Exception:
-        state['job_tier'] = 'N/A'
+        out = {}
+    # the model may return null, booleans or a non-object; normalize before use
+    if not isinstance(out, dict):
+        out = {}
+    model_relevant = str(out.get('is_relevant')).casefold() == 'yes'
+    state['is_relevant'] = 'Yes' if keyword_match or model_relevant else 'No'
+    tier = out.get('job_tier')
+    state['job_tier'] = tier if isinstance(tier, str) and tier in JOB_TIERS else 'N/A'
     return state
 
-def build_graph(client: Groq) -> StateGraph:
-    g = StateGraph(JobState)
-    g.add_node('relevance', lambda s: check_relevance(s, client))
-    g.add_node('competitor', lambda s: check_competitor(s, client))
-    g.add_node('tier', lambda s: determine_tier(s, client))
-    g.add_edge('relevance','competitor')
-    g.add_edge('competitor','tier')
-    g.set_entry_point('relevance')
-    g.set_finish_point('tier')
-    return g
-
 # ------------------------- JOB PROCESSING -------------------------
-def process_job(job: dict, field: str, client: Groq, tavily_client: TavilyClient) -> Optional[dict]:
-    global GLOBAL_FIELD
-    GLOBAL_FIELD = field
+async def process_job(job: dict, field: str, client: AsyncGroq, sem: asyncio.Semaphore) -> Optional[dict]:
     state: JobState = JobState(
         Title=job['Title'], Company=job['Company'], Experience=job['Experience'],
         Description=job['Description'], is_relevant=None, is_competitor=None, job_tier=None
     )
-    result = build_graph(client).compile().invoke(state)
-    if result['is_relevant'].lower()!='yes' or result['is_competitor'].lower()!='no':
+    # competitor check is a local lookup, so skip the LLM call for competitors
+    if check_competitor(state)['is_competitor'] == 'Yes':
         return None
+    async with sem:
+        result = await classify_job(state, client, field)
+        if result['is_relevant'] != 'Yes':
+            return None
     job['Job Tier'] = result['job_tier']
-    link = get_company_career_page(job['Company'], tavily_client)
-    if not link:
-        return None
-    job['Job Link'] = link
     return job
 
 # ------------------------- RECENCY FILTER -------------------------
+# Posted within the last 3 days, e.g. "Just Now", "Today", "2 Days Ago"
+RECENT_RE = re.compile(r'\b(just now|few hours|today|[123]\s*days?)\b', re.IGNORECASE)
+
 def is_job_recent(date_str: str) -> bool:
-    low = date_str.lower()
-    return any(x in low for x in ['just now','few hours','today','1 day','2 days','3 days'])
+    return bool(RECENT_RE.search(date_str))
 
 # ------------------------- FIRECRAWL SCRAPER -------------------------
-def scrape_url(url: str, fc_app: FirecrawlApp) -> pd.DataFrame:
-    resp = fc_app.scrape_url(url, formats=['html'], actions=[{'type':'wait','milliseconds':7000}])
-    soup = BeautifulSoup(resp.html, 'html.parser')
-    rows = []
-    for w in soup.select('div.srp-jobtuple-wrapper'):
-        title_elem = w.select_one('a.title')
-        link = title_elem['href'] if title_elem and title_elem.has_attr('href') else ''
-        rows.append({
-            'Title': title_elem.get_text(strip=True) if title_elem else '',
-            'Company': w.select_one('a.comp-name, a.subTitle').get_text(strip=True) if w.select_one('a.comp-name, a.subTitle') else '',
-            'Experience': w.select_one('span.expwdth, li.experience').get_text(strip=True) if w.select_one('span.expwdth, li.experience') else '',
-            'Description': w.select_one('span.job-desc, div.job-description').get_text(strip=True) if w.select_one('span.job-desc, div.job-description') else '',
-            'Posted Date': w.select_one('span.fleft.postedDate, span.job-post-day').get_text(strip=True) if w.select_one('span.fleft.postedDate, span.job-post-day') else '',
-            'Location': w.select_one('span.locWdth, li.location').get_text(strip=True) if w.select_one('span.locWdth, li.location') else '',
-            'Salary': w.select_one('span.sal-wrap, li.salary').get_text(strip=True) if w.select_one('span.sal-wrap, li.salary') else 'Not disclosed',
-            'Skills': ', '.join(t.get_text(strip=True) for t in w.select('li.tag, li.tag-li')),
-            'Job Link': link
-        })
-    return pd.DataFrame(rows)
+FIRECRAWL_SCRAPE_URL = "https://api.firecrawl.dev/v1/scrape"
+JOB_COLUMNS = ['Title', 'Company', 'Experience', 'Description', 'Posted Date',
+               'Location', 'Salary', 'Skills', 'Job Link']
+
+def node_text(node: Node, sel: str, default: str = '') -> str:
+    n = node.css_first(sel)
+    return n.text(strip=True) if n else default
+
+async def scrape_url(url: str, hx: httpx.AsyncClient, api_key: str) -> pd.DataFrame:
+    # only the job cards are parsed, so have Firecrawl drop the rest of the page
+    resp = await hx.post(
+        FIRECRAWL_SCRAPE_URL,
+        json={
+            'url': url, 'formats': ['html'], 'includeTags': ['div.srp-jobtuple-wrapper'],
+            'actions': [{'type':'wait','milliseconds':7000}]
+        },
+        headers={'Authorization': f"Bearer {api_key}"},
+        # the page render and wait action take longer than the client default
+        timeout=60
+    )
+    resp.raise_for_status()
+    tree = HTMLParser(resp.json()['data'].get('html') or '')
+    # accumulate column-wise so pandas needn't transpose a list of row dicts
+    cols = {c: [] for c in JOB_COLUMNS}
+    for w in tree.css('div.srp-jobtuple-wrapper'):
+        title_elem = w.css_first('a.title')
+        cols['Title'].append(title_elem.text(strip=True) if title_elem else '')
+        cols['Company'].append(node_text(w, 'a.comp-name, a.subTitle'))
+        cols['Experience'].append(node_text(w, 'span.expwdth, li.experience'))
+        cols['Description'].append(node_text(w, 'span.job-desc, div.job-description'))
+        cols['Posted Date'].append(node_text(w, 'span.fleft.postedDate, span.job-post-day'))
+        cols['Location'].append(node_text(w, 'span.locWdth, li.location'))
+        cols['Salary'].append(node_text(w, 'span.sal-wrap, li.salary', 'Not disclosed'))
+        cols['Skills'].append(', '.join(t.text(strip=True) for t in w.css('li.tag, li.tag-li')))
+        cols['Job Link'].append((title_elem.attributes.get('href') or '') if title_elem else '')
+    return pd.DataFrame(cols, columns=JOB_COLUMNS, dtype=str)
+
+# ------------------------- NAUKRI SEARCH API -------------------------
+NAUKRI_API_URL = "https://www.naukri.com/jobapi/v3/search"
+NAUKRI_API_HEADERS = {'appid': '109', 'systemid': 'Naukri'}
+
+def parse_naukri_jobs(job_details: list[dict]) -> pd.DataFrame:
+    cols = {c: [] for c in JOB_COLUMNS}
+    for j in job_details:
+        placeholders = {p.get('type'): p.get('label') or '' for p in j.get('placeholders') or []}
+        description = j.get('jobDescription') or ''
+        cols['Title'].append(j.get('title') or '')
+        cols['Company'].append(j.get('companyName') or '')
+        cols['Experience'].append(placeholders.get('experience', ''))
+        # descriptions come back as HTML snippets
+        cols['Description'].append(HTMLParser(description).text(separator=' ', strip=True) if description else '')
+        cols['Posted Date'].append(j.get('footerPlaceholderLabel') or '')
+        cols['Location'].append(placeholders.get('location', ''))
+        cols['Salary'].append(placeholders.get('salary') or 'Not disclosed')
+        cols['Skills'].append(', '.join(t.strip() for t in (j.get('tagsAndSkills') or '').split(',') if t.strip()))
+        cols['Job Link'].append(urljoin('https://www.naukri.com', j.get('jdURL') or ''))
+    return pd.DataFrame(cols, columns=JOB_COLUMNS, dtype=str)
 
 # ------------------------- DOMAIN SCRAPE & PROCESS -------------------------
-def scrape_jobs_for_domain(domain: str, client: Groq, tavily_client: TavilyClient, fc_app: FirecrawlApp) -> pd.DataFrame:
-    global GLOBAL_FIELD
-    GLOBAL_FIELD = domain
+async def fetch_domain_jobs(domain: str, hx: httpx.AsyncClient, fc_key: str) -> pd.DataFrame:
     keyword = FIELD_KEYWORDS[domain]
+    params = {
+        'noOfResults': 100, 'urlType': 'search_by_keyword', 'searchType': 'adv',
+        'keyword': keyword, 'location': 'india', 'jobAge': 3, 'pageNo': 1
+    }
+    try:
+        resp = await hx.get(NAUKRI_API_URL, params=params, headers=NAUKRI_API_HEADERS)
+        resp.raise_for_status()
+        data = resp.json()
+    except (httpx.HTTPError, ValueError):
+        data = None
+    job_details = data.get('jobDetails') if isinstance(data, dict) else None
+    if job_details is not None:
+        return parse_naukri_jobs(job_details)
+    # API blocked (captcha, anti-bot, rate limit) or unavailable, render the search page through Firecrawl instead
     url = f"https://www.naukri.com/jobs-in-india?k={keyword}&l=india&jobAge=3"
-    df_raw = scrape_url(url, fc_app)
+    return await scrape_url(url, hx, fc_key)
+
+async def process_domain_jobs(domain: str, df_raw: pd.DataFrame, client: AsyncGroq,
+                              hx: httpx.AsyncClient, tavily_key: str, sem: asyncio.Semaphore,
+                              lookup_sem: asyncio.Semaphore) -> pd.DataFrame:
+    if df_raw.empty:
+        return pd.DataFrame()
+    # drop stale listings before spending any LLM calls on them
+    df_raw = df_raw[df_raw['Posted Date'].map(is_job_recent)]
+    # listings repeat across pages and cross-posts; classify each (company, title) once
+    keys = df_raw[['Company', 'Title']].apply(lambda col: col.str.casefold())
+    df_raw = df_raw[~keys.duplicated()]
+    # plain tuples, since itertuples would rename columns like 'Posted Date'
+    rows = df_raw.itertuples(index=False, name=None)
+    tasks = [process_job(dict(zip(JOB_COLUMNS, row)), domain, client, sem) for row in rows]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    fatal = next((r for r in results if isinstance(r, GROQ_FATAL_ERRORS)), None)
+    if fatal is not None:
+        raise fatal
+    classified = [p for p in results if isinstance(p, dict)]
+    # resolve career pages once per company, concurrently
+    links = await get_career_pages({job['Company'] for job in classified}, hx, tavily_key, lookup_sem)
     processed = []
-    for job in df_raw.to_dict('records'):
-        p = process_job(job, domain, client, tavily_client)
-        if p and is_job_recent(job['Posted Date']):
-            processed.append(p)
-    return pd.DataFrame(processed)
+    for job in classified:
+        if links[job['Company']]:
+            job['Job Link'] = links[job['Company']]
+            processed.append(job)
+    df = pd.DataFrame(processed)
+    # rows from several domains are concatenated, and the same listing can match more than one
+    if not df.empty:
+        df.insert(0, 'Domain', domain)
+    return df
+
+async def scrape_jobs_for_domains(domains: list[str], groq_key: str, tavily_key: str,
+                                  fc_key: str) -> tuple[pd.DataFrame, dict[str, str]]:
+    # semaphores shared across domains keep the Groq and Tavily concurrency bounds global
+    sem = asyncio.Semaphore(MAX_CONCURRENT_JOBS)
+    lookup_sem = asyncio.Semaphore(MAX_CONCURRENT_LOOKUPS)
+
+    async def scrape_domain(domain: str) -> pd.DataFrame:
+        df_raw = await fetch_domain_jobs(domain, hx, fc_key)
+        return await process_domain_jobs(domain, df_raw, client, hx, tavily_key, sem, lookup_sem)
+
+    # AsyncGroq's connection pool is bound to the event loop, so it lives for one run.
+    # Naukri, Firecrawl and Tavily calls share one keep-alive HTTP/2 pool.
+    limits = httpx.Limits(max_keepalive_connections=20)
+    async with AsyncGroq(api_key=groq_key, max_retries=GROQ_MAX_RETRIES) as client, \
+            httpx.AsyncClient(http2=True, limits=limits, timeout=30) as hx:
+        # domains run end to end concurrently, overlapping Firecrawl waits and LLM calls
+        results = await asyncio.gather(*[scrape_domain(d) for d in domains], return_exceptions=True)
+    # a failing domain is reported on its own instead of discarding the others
+    dfs = [r for r in results if isinstance(r, pd.DataFrame)]
+    failures = {d: f"{type(r).__name__}: {r}" for d, r in zip(domains, results) if isinstance(r, BaseException)}
+    df = pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame()
+    return df, failures
 
 # ------------------------- EXCEL EXPORT -------------------------
 def to_excel(df: pd.DataFrame) -> bytes:
+    # write-only mode streams rows straight to the sheet, skipping pandas' per-cell formatter
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet('Sheet1')
+    ws.append(list(df.columns))
+    for row in df.itertuples(index=False, name=None):
+        # openpyxl rejects control characters and non-scalar cells that xlsxwriter tolerated
+        ws.append([ILLEGAL_CHARACTERS_RE.sub('', v if isinstance(v, str) else str(v)) for v in row])
     buf = BytesIO()
-    with pd.ExcelWriter(buf, engine='xlsxwriter') as writer:
-        df.to_excel(writer, index=False)
+    wb.save(buf)
     return buf.getvalue()
 
 # ------------------------- STREAMLIT APP -------------------------
+class UncachedScrape(Exception):
+    # raised out of scrape_cached so st.cache_data skips storing the result
+    def __init__(self, df: pd.DataFrame, failures: dict[str, str]):
+        super().__init__(failures)
+        self.df = df
+        self.failures = failures
+
+def key_fingerprint(*keys: str) -> str:
+    return hashlib.sha256('\0'.join(keys).encode()).hexdigest()
+
+@st.cache_data(ttl=600, show_spinner=False)
+def scrape_cached(domains: tuple[str, ...], fingerprint: str, _groq_key: str, _tavily_key: str,
+                  _fc_key: str) -> pd.DataFrame:
+    df, failures = asyncio.run(scrape_jobs_for_domains(list(domains), _groq_key, _tavily_key, _fc_key))
+    # degraded or empty runs are often a bad key or a transient outage; don't pin them for 10 minutes
+    if failures or df.empty:
+        raise UncachedScrape(df, failures)
+    return df
+
+def scrape(domains: list[str], groq_key: str, tavily_key: str, fc_key: str) -> tuple[pd.DataFrame, dict[str, str]]:
+    # the fingerprint keeps results from one set of keys away from sessions using another
+    fingerprint = key_fingerprint(groq_key, tavily_key, fc_key)
+    try:
+        return scrape_cached(tuple(domains), fingerprint, groq_key, tavily_key, fc_key), {}
+    except UncachedScrape as e:
+        return e.df, e.failures
+
 def main():
     st.set_page_config(page_title='Job Scraper', layout='wide')
     st.title('🌐 Job Scraper - Domain Specific')
@@ -195,19 +383,21 @@ def main():
     if not groq_key or not tavily_key or not fc_key:
         st.warning('Enter all API keys')
         return
-    client = Groq(api_key=groq_key)
-    tavily = TavilyClient(tavily_key)
-    fc_app = FirecrawlApp(api_key=fc_key)
-    domain = st.selectbox('Select Domain', list(FIELD_KEYWORDS.keys()))
+    domains = st.multiselect('Select Domains', list(FIELD_KEYWORDS.keys()))
     if st.button('🔍 Scrape Jobs'):
-        with st.spinner(f"Scraping {domain} jobs up to 3 days..."):
-            df = scrape_jobs_for_domain(domain, client, tavily, fc_app)
+        if not domains:
+            st.warning('Select at least one domain')
+            return
+        with st.spinner(f"Scraping {', '.join(domains)} jobs up to 3 days..."):
+            df, failures = scrape(domains, groq_key, tavily_key, fc_key)
+        for domain, error in failures.items():
+            st.warning(f"Could not scrape {domain} jobs: {error}")
         if df.empty:
             st.info('No relevant jobs found')
         else:
             st.dataframe(df)
             data = to_excel(df)
-            st.download_button('📥 Download Excel', data, file_name=f"jobs_{domain}.xlsx")
+            st.download_button('📥 Download Excel', data, file_name=f"jobs_{'_'.join(domains)}.xlsx")
 
 if __name__=='__main__':
     main()